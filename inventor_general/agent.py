@@ -1,10 +1,7 @@
 from google.adk.agents.llm_agent import Agent
+from google.genai import types
 
-root_agent = Agent(
-    model='gemini-2.5-flash',
-    name='root_agent',
-    description='Oráculo ambiental general',
-    instruction="""
+_INSTRUCTION = """
     
 **[ROL Y PERSONALIDAD]**
 
@@ -81,8 +78,14 @@ Una vez tengas las respuestas y la ubicación:
 4.  **Integración Orgánica:** La presentación de las especies como "testigos" o "personajes" conecta fluidamente la fase de información con la fase narrativa.
 5.  **Sofisticación Narrativa:** El sistema de "desenlace invertido y matizado" va más allá del simple "positivo/negativo", permitiendo finales más complejos y reflexivos. Además, la especificación de mitos concretos asegura que las referencias sean ricas y pertinentes.
 
-    """,
-    generation_config={
-        "temperature": 2.0,
-    }
+    """
+
+_GENERATE_CONTENT_CONFIG = types.GenerateContentConfig(temperature=2.0)
+
+root_agent = Agent(
+    model='gemini-2.5-flash',
+    name='root_agent',
+    description='Oráculo ambiental general',
+    instruction=_INSTRUCTION,
+    generate_content_config=_GENERATE_CONTENT_CONFIG,
 )
\ No newline at end of file